@@ -1,14 +1,30 @@
-import pandas as pd
+import os
 import numpy as np
 from gurobipy import *
+from online_cov import OnlineCovariance, update_portfolio_model
 
 # Data loading and preprocessing
-data = pd.read_csv(r"d:\Visual Studio Code\Operation Research\data_portfolio.csv")
-stocks = data.columns.values
+here = os.path.dirname(os.path.abspath(__file__))
+data_file = os.path.join(
+    here,
+    "..",
+    "lecture note",
+    "lec3",
+    "data_portfolio.csv",
+)
+state_file = os.path.join(here, "portfolio_state.npz")
 
 # Calculate mean returns and covariance matrix
-mu = data.mean()
-Sigma = data.cov()
+# (reuse the saved running estimate and only read rows appended since the last run;
+# rebuild it if the CSV was replaced or edited)
+try:
+    est = OnlineCovariance.load(state_file).update_csv(data_file)
+except (OSError, KeyError, ValueError):  # no state yet, old format, or new CSV
+    est = OnlineCovariance.from_csv(data_file)
+est.save(state_file)
+stocks = np.array(est.columns)
+mu = est.mean
+Sigma = est.cov
 
 # Set parameters
 B = 1000  # budget
@@ -30,7 +46,9 @@ m.setObjective(obj, GRB.MINIMIZE)
 m.addConstr(quicksum(x_bar[s] for s in stocks) <= B * z, name="budget")
 
 # Expected return constraint: μ'x_bar - βz = 1
-m.addConstr(quicksum(mu[s] * x_bar[s] for s in stocks) - beta * z == 1, name="return")
+return_con = m.addConstr(
+    quicksum(mu[s] * x_bar[s] for s in stocks) - beta * z == 1, name="return"
+)
 
 # Non-negativity constraints
 m.addConstr(z >= 0, name="z_nonneg")
@@ -64,3 +82,13 @@ if m.status == GRB.OPTIMAL:
     print(f"Sharpe Ratio: {(exp_return - beta)/risk:.4f}")
 else:
     print("Model optimization failed")
+
+
+# Daily update: call after appending the new returns row to data_portfolio.csv.
+# Only the new row is read, the estimate is updated in O(n^2) and only the
+# coefficients of the existing model change before re-optimizing.
+def new_day():
+    est.update_csv(data_file)
+    est.save(state_file)
+    update_portfolio_model(m, x_bar, return_con, est.mean, est.cov)
+    m.optimize()
@@ -0,0 +1,228 @@
+import hashlib
+import io
+import os
+
+import numpy as np
+import pandas as pd
+
+
+class OnlineCovariance:
+    """Running mean and covariance of return rows, updated one day at a time.
+
+    mode = "expanding": Welford updates over the whole history.
+    mode = "rolling":   the last `window` rows only (oldest row is downdated).
+    mode = "ewm":       exponentially weighted, mean += alpha * (x - mean).
+
+    Every update costs O(n^2) in the number of stocks, independent of the
+    history length T.
+    """
+
+    def __init__(self, columns, mode="expanding", window=None, alpha=None):
+        if mode == "rolling" and (window or 0) < 2:
+            raise ValueError("rolling mode needs a window size of at least 2")
+        if mode == "ewm" and not 0 < (alpha or 0) <= 1:
+            raise ValueError("ewm mode needs 0 < alpha <= 1")
+        self.columns = list(columns)
+        self.mode = mode
+        self.window = window
+        self.alpha = alpha
+        n = len(self.columns)
+        self.rows_seen = 0  # rows read from the source so far
+        self.source = ""  # CSV the rows came from
+        self.offset = 0  # bytes of the source consumed so far
+        self.source_hash = ""  # hash of its header and last consumed line
+        self.count = 0  # rows currently inside the estimate
+        self.mean_ = np.zeros(n)
+        self.m2 = np.zeros((n, n))  # sum of outer products of deviations
+        self.buffer = np.zeros((window or 0, n))  # ring buffer for rolling mode
+
+    # ----- updates -----
+    def _add(self, x):
+        self.count += 1
+        dx = x - self.mean_
+        self.mean_ += dx / self.count
+        self.m2 += np.outer(dx, x - self.mean_)
+
+    def _remove(self, x):
+        self.count -= 1
+        dx = x - self.mean_
+        self.mean_ -= dx / self.count
+        self.m2 -= np.outer(x - self.mean_, dx)
+
+    def update(self, x):
+        """Add one row of returns."""
+        x = np.asarray(x, dtype=float)
+        if self.mode == "ewm":
+            if self.count == 0:
+                self.mean_ = x.copy()
+            else:
+                a = self.alpha
+                dx = x - self.mean_
+                self.mean_ += a * dx
+                self.m2 = (1 - a) * (self.m2 + a * np.outer(dx, dx))
+            self.count += 1
+        elif self.mode == "rolling":
+            slot = self.rows_seen % self.window
+            if self.count == self.window:
+                self._remove(self.buffer[slot])
+            self.buffer[slot] = x
+            self._add(x)
+        else:
+            self._add(x)
+        self.rows_seen += 1
+
+    def update_batch(self, X):
+        """Add a block of rows; expanding mode merges the block in one step."""
+        X = np.asarray(X, dtype=float)
+        if self.mode != "expanding" or len(X) == 0:
+            for x in X:
+                self.update(x)
+            return
+        # Chan et al. pairwise merge of (count, mean, m2)
+        k = len(X)
+        mean_b = X.mean(axis=0)
+        dev = X - mean_b
+        m2_b = dev.T @ dev
+        delta = mean_b - self.mean_
+        total = self.count + k
+        self.m2 += m2_b + np.outer(delta, delta) * self.count * k / total
+        self.mean_ += delta * k / total
+        self.count = total
+        self.rows_seen += k
+
+    def matches(self, filename):
+        """True if filename still starts with the rows already in the estimate.
+
+        Only the header and the last consumed line are compared, so the check
+        does not depend on the length of the history.
+        """
+        if os.path.abspath(filename) != self.source:
+            return False
+        with open(filename, "rb") as f:
+            return self._fingerprint(f) == self.source_hash
+
+    def _fingerprint(self, f):
+        if os.fstat(f.fileno()).st_size < self.offset:
+            return None
+        return _fingerprint(f, self.offset)
+
+    def update_csv(self, filename, chunksize=10000):
+        """Read the rows of filename appended since the last call, chunk by chunk.
+
+        Reading starts at the saved byte offset, so appending a day costs
+        O(n^2) however long the file already is.
+        """
+        with open(filename, "rb") as f:
+            if self.offset and (
+                os.path.abspath(filename) != self.source
+                or self._fingerprint(f) != self.source_hash
+            ):
+                raise ValueError(
+                    f"{filename} is not the source of this estimate or was edited; "
+                    "rebuild it with from_csv"
+                )
+            f.seek(0)
+            names = pd.read_csv(io.BytesIO(f.readline()), nrows=0).columns
+            f.seek(max(self.offset, f.tell()))
+            if f.tell() < os.fstat(f.fileno()).st_size:
+                reader = pd.read_csv(f, header=None, names=names, chunksize=chunksize)
+                for chunk in reader:
+                    self.update_batch(chunk[self.columns].values)
+            self.offset = f.tell()
+            self.source = os.path.abspath(filename)
+            self.source_hash = _fingerprint(f, self.offset)
+        return self
+
+    @classmethod
+    def from_csv(cls, filename, chunksize=10000, **kwargs):
+        columns = pd.read_csv(filename, nrows=0).columns
+        return cls(columns, **kwargs).update_csv(filename, chunksize)
+
+    # ----- estimates -----
+    @property
+    def mean(self):
+        return pd.Series(self.mean_, index=self.columns)
+
+    @property
+    def cov(self):
+        if self.mode == "ewm":
+            sigma = self.m2
+        else:
+            sigma = self.m2 / max(self.count - 1, 1)  # same ddof as DataFrame.cov()
+        return pd.DataFrame(sigma, index=self.columns, columns=self.columns)
+
+    # ----- persistence -----
+    def save(self, filename):
+        np.savez(
+            filename,
+            columns=np.array(self.columns),
+            mode=self.mode,
+            window=self.window or 0,
+            alpha=self.alpha or 0.0,
+            rows_seen=self.rows_seen,
+            source=self.source,
+            offset=self.offset,
+            source_hash=self.source_hash,
+            count=self.count,
+            mean=self.mean_,
+            m2=self.m2,
+            buffer=self.buffer,
+        )
+
+    @classmethod
+    def load(cls, filename):
+        state = np.load(filename)
+        est = cls(
+            state["columns"].tolist(),
+            mode=str(state["mode"]),
+            window=int(state["window"]) or None,
+            alpha=float(state["alpha"]) or None,
+        )
+        est.rows_seen = int(state["rows_seen"])
+        est.source = str(state["source"])
+        est.offset = int(state["offset"])
+        est.source_hash = str(state["source_hash"])
+        est.count = int(state["count"])
+        est.mean_ = state["mean"].copy()
+        est.m2 = state["m2"].copy()
+        est.buffer = state["buffer"].copy()
+        return est
+
+
+def _fingerprint(f, offset, block=4096):
+    """md5 of the header and of the last complete line before byte `offset`."""
+    f.seek(0)
+    digest = hashlib.md5(f.readline().rstrip(b"\r\n"))
+    start = offset
+    tail = b""
+    while start > 0:  # read backwards until the line before `offset` is whole
+        start = max(start - block, 0)
+        f.seek(start)
+        tail = f.read(offset - start).rstrip(b"\r\n")
+        if b"\n" in tail:
+            break
+    digest.update(b"\n" + tail.rsplit(b"\n", 1)[-1])
+    return digest.hexdigest()
+
+
+def update_portfolio_model(m, x, return_con, mu, Sigma):
+    """Push new mu / Sigma into an existing portfolio model without rebuilding it.
+
+    x maps stock -> variable, return_con is the expected-return constraint.
+    Only coefficients change: the return row via chgCoeff and the quadratic
+    objective x'Sigma x is replaced on the same variables.
+    """
+    import gurobipy as gp
+
+    stocks = list(mu.index)
+    for s in stocks:
+        m.chgCoeff(return_con, x[s], mu[s])
+    xs = [x[s] for s in stocks]
+    n = len(xs)
+    obj = gp.QuadExpr()
+    obj.addTerms(
+        Sigma.loc[stocks, stocks].values.ravel().tolist(),
+        [xs[i] for i in range(n) for _ in range(n)],
+        xs * n,
+    )
+    m.setObjective(obj, gp.GRB.MINIMIZE)
@@ -0,0 +1,351 @@
+import os
+import time
+from collections import namedtuple
+from concurrent.futures import ProcessPoolExecutor
+
+import numpy as np
+import pandas as pd
+import scipy.sparse as sp
+from scipy.optimize import Bounds, LinearConstraint, milp
+
+# ----- a thin linear / integer model that can be solved by Gurobi or HiGHS -----
+# Variables are plain index ranges and constraints are added as sparse
+# (row, col, val) triplets with lo <= A x <= hi, so a model is assembled with
+# NumPy instead of one Python call per term. gurobipy is only imported when
+# the Gurobi backend is used, so the HiGHS path (scipy.optimize.milp) runs on
+# machines without a Gurobi license.
+
+Result = namedtuple("Result", ["status", "obj", "x", "runtime"])
+
+
+class LinearModel:
+    def __init__(self, name, sense="min"):
+        self.name = name
+        self.sense = sense
+        self.num_vars = 0
+        self.num_rows = 0
+        self.c, self.lb, self.ub, self.integer = [], [], [], []
+        self.rows, self.cols, self.vals = [], [], []
+        self.lo, self.hi = [], []
+
+    def add_vars(self, shape, lb=0.0, ub=np.inf, integer=False, obj=0.0):
+        """Add variables; returns their indices as an array of the given shape."""
+        size = int(np.prod(shape))
+        idx = np.arange(self.num_vars, self.num_vars + size)
+        self.num_vars += size
+        self.c.append(np.broadcast_to(np.asarray(obj, dtype=float).ravel(), size))
+        self.lb.append(np.broadcast_to(np.asarray(lb, dtype=float).ravel(), size))
+        self.ub.append(np.broadcast_to(np.asarray(ub, dtype=float).ravel(), size))
+        self.integer.append(np.full(size, integer))
+        return idx.reshape(shape)
+
+    def add_rows(self, rows, cols, vals, lo=-np.inf, hi=np.inf):
+        """Add lo <= A x <= hi where A is given by triplets; rows are numbered
+        from 0 within this call. Returns the global indices of the new rows."""
+        rows = np.asarray(rows).ravel()
+        if rows.size == 0:
+            return np.arange(self.num_rows, self.num_rows)
+        count = int(rows.max()) + 1
+        self.rows.append(rows + self.num_rows)
+        self.cols.append(np.asarray(cols).ravel())
+        self.vals.append(
+            np.broadcast_to(np.asarray(vals, dtype=float).ravel(), rows.size)
+        )
+        self.lo.append(np.broadcast_to(np.asarray(lo, dtype=float).ravel(), count))
+        self.hi.append(np.broadcast_to(np.asarray(hi, dtype=float).ravel(), count))
+        self.num_rows += count
+        return np.arange(self.num_rows - count, self.num_rows)
+
+    def matrices(self):
+        A = sp.csr_matrix(
+            (
+                np.concatenate(self.vals),
+                (np.concatenate(self.rows), np.concatenate(self.cols)),
+            ),
+            shape=(self.num_rows, self.num_vars),
+        )
+        return (
+            np.concatenate(self.c),
+            np.concatenate(self.lb),
+            np.concatenate(self.ub),
+            np.concatenate(self.integer),
+            A,
+            np.concatenate(self.lo),
+            np.concatenate(self.hi),
+        )
+
+    def solve(self, backend="highs", time_limit=None, threads=None, env=None):
+        c, lb, ub, integer, A, lo, hi = self.matrices()
+        start = time.perf_counter()
+        if backend == "gurobi":
+            status, obj, x = _solve_gurobi(
+                self, c, lb, ub, integer, A, lo, hi, time_limit, threads, env
+            )
+        elif backend == "highs":
+            status, obj, x = _solve_highs(
+                self, c, lb, ub, integer, A, lo, hi, time_limit
+            )
+        else:
+            raise ValueError(f"unknown backend: {backend}")
+        return Result(status, obj, x, time.perf_counter() - start)
+
+
+def _solve_highs(model, c, lb, ub, integer, A, lo, hi, time_limit):
+    sign = -1.0 if model.sense == "max" else 1.0
+    options = {"disp": False}
+    if time_limit is not None:
+        options["time_limit"] = time_limit
+    res = milp(
+        sign * c,
+        constraints=LinearConstraint(A, lo, hi),
+        bounds=Bounds(lb, ub),
+        integrality=integer.astype(int),
+        options=options,
+    )
+    status = "optimal" if res.status == 0 else res.message
+    obj = sign * res.fun if res.x is not None else None
+    return status, obj, res.x
+
+
+def _solve_gurobi(model, c, lb, ub, integer, A, lo, hi, time_limit, threads, env):
+    import gurobipy as gp
+
+    m = gp.Model(model.name, env=env) if env is not None else gp.Model(model.name)
+    m.params.OutputFlag = 0
+    if time_limit is not None:
+        m.params.TimeLimit = time_limit
+    if threads is not None:
+        m.params.Threads = threads
+    vtype = np.where(integer, gp.GRB.INTEGER, gp.GRB.CONTINUOUS)
+    x = m.addMVar(model.num_vars, lb=lb, ub=ub, vtype=vtype)
+    sense = gp.GRB.MAXIMIZE if model.sense == "max" else gp.GRB.MINIMIZE
+    m.setObjective(c @ x, sense)
+    eq = lo == hi
+    if eq.any():
+        m.addConstr(A[eq] @ x == lo[eq])
+    le = ~eq & np.isfinite(hi)
+    if le.any():
+        m.addConstr(A[le] @ x <= hi[le])
+    ge = ~eq & np.isfinite(lo)
+    if ge.any():
+        m.addConstr(A[ge] @ x >= lo[ge])
+    m.optimize()
+    if m.SolCount == 0:
+        return m.status, None, None
+    status = "optimal" if m.status == gp.GRB.OPTIMAL else m.status
+    return status, m.objVal, x.X
+
+
+# ----- course models on the backend -----
+def transportation(capacity, demand, cost, integer=False):
+    """Plants i ship x[i, j] to retailers j: capacity <=, demand ==."""
+    cost = np.asarray(cost, dtype=float)
+    m, n = cost.shape
+    model = LinearModel("transportation")
+    x = model.add_vars((m, n), integer=integer, obj=cost)
+    rows = np.repeat(np.arange(m), n)
+    model.add_rows(rows, x.ravel(), 1.0, hi=capacity)
+    rows = np.tile(np.arange(n), m)
+    model.add_rows(rows, x.ravel(), 1.0, lo=demand, hi=demand)
+    return model, x
+
+
+def store_selection(revenues, proximity_sets):
+    """Keep stores open to maximize revenue, at most one per proximity set."""
+    stores = list(revenues.keys())
+    pos = {s: k for k, s in enumerate(stores)}
+    model = LinearModel("store_selection", sense="max")
+    x = model.add_vars(
+        len(stores), ub=1, integer=True, obj=[revenues[s] for s in stores]
+    )
+    rows = np.concatenate([np.full(len(g), k) for k, g in enumerate(proximity_sets)])
+    cols = x[[pos[s] for g in proximity_sets for s in g]]
+    model.add_rows(rows, cols, 1.0, hi=1)
+    return model, x
+
+
+def pmedian(dist, p):
+    """Open p facilities and assign every customer i to one open facility j."""
+    n = len(dist)
+    model = LinearModel("pmedian")
+    x = model.add_vars(n, ub=1, integer=True)
+    y = model.add_vars((n, n), ub=1, integer=True, obj=dist)
+    model.add_rows(np.repeat(np.arange(n), n), y.ravel(), 1.0, lo=1, hi=1)  # cover
+    model.add_rows(np.zeros(n, dtype=int), x, 1.0, lo=p, hi=p)  # p_location
+    k = np.arange(n * n)
+    model.add_rows(  # y[i, j] <= x[j]
+        np.concatenate([k, k]),
+        np.concatenate([y.ravel(), np.tile(x, n)]),
+        np.concatenate([np.ones(n * n), -np.ones(n * n)]),
+        hi=0,
+    )
+    return model, x, y
+
+
+def fcfl(dist, d, f, v):
+    """Fixed-charge facility location with capacities v and demands d."""
+    n = len(dist)
+    d = np.asarray(d, dtype=float)
+    model = LinearModel("fixed_charge_facility_location")
+    x = model.add_vars(n, ub=1, integer=True, obj=f)
+    y = model.add_vars((n, n), ub=1, obj=dist * d[:, None])
+    model.add_rows(np.repeat(np.arange(n), n), y.ravel(), 1.0, lo=1, hi=1)  # demand
+    model.add_rows(  # sum_i d[i] y[i, j] <= v[j] x[j]
+        np.concatenate([np.tile(np.arange(n), n), np.arange(n)]),
+        np.concatenate([y.ravel(), x]),
+        np.concatenate([np.repeat(d, n), -np.asarray(v, dtype=float)]),
+        hi=0,
+    )
+    k = np.arange(n * n)
+    model.add_rows(  # y[i, j] <= x[j]
+        np.concatenate([k, k]),
+        np.concatenate([y.ravel(), np.tile(x, n)]),
+        np.concatenate([np.ones(n * n), -np.ones(n * n)]),
+        hi=0,
+    )
+    return model, x, y
+
+
+def sudoku(puzzle):
+    """x[i, j, k] = 1 if cell (i, j) holds digit k + 1; givens are fixed by bounds."""
+    puzzle = np.asarray(puzzle, dtype=int)
+    lb = np.zeros((9, 9, 9))
+    i, j = np.nonzero(puzzle)
+    lb[i, j, puzzle[i, j] - 1] = 1
+    model = LinearModel("Sudoku")
+    x = model.add_vars((9, 9, 9), lb=lb, ub=1, integer=True)
+    box = (np.arange(9)[:, None] // 3) * 3 + np.arange(9)[None, :] // 3
+    I, J, K = np.meshgrid(np.arange(9), np.arange(9), np.arange(9), indexing="ij")
+    for group in (I * 9 + J, I * 9 + K, J * 9 + K, box[I, J] * 9 + K):
+        model.add_rows(group.ravel(), x.ravel(), 1.0, lo=1, hi=1)
+    return model, x
+
+
+def orienteering(loc_x, loc_y, s, T):
+    """Maximize collected score on a tour from node 0 within travel budget T (MTZ)."""
+    n = len(s)
+    dx = np.subtract.outer(loc_x, loc_x).astype(float)
+    dy = np.subtract.outer(loc_y, loc_y).astype(float)
+    c = np.sqrt(dx**2 + dy**2)
+    ub = 1 - np.eye(n)
+    model = LinearModel("Orienteering", sense="max")
+    x = model.add_vars((n, n), ub=ub, integer=True)
+    u = model.add_vars(n - 1, lb=1, ub=n - 1, integer=True)  # u[i - 1] for node i
+    y = model.add_vars(n, lb=np.eye(1, n), ub=1, integer=True, obj=s)
+    I, J = np.meshgrid(np.arange(n), np.arange(n), indexing="ij")
+    for node in (J, I):  # in_flow, out_flow: sum of arcs at node == y[node]
+        model.add_rows(
+            np.concatenate([node.ravel(), np.arange(n)]),
+            np.concatenate([x.ravel(), y]),
+            np.concatenate([np.ones(n * n), -np.ones(n)]),
+            lo=0,
+            hi=0,
+        )
+    model.add_rows(np.zeros(n * n, dtype=int), x.ravel(), c.ravel(), hi=T)  # budget
+    i, j = np.nonzero(~np.eye(n - 1, dtype=bool))  # mtz over nodes 1..n-1
+    k = np.arange(len(i))
+    model.add_rows(
+        np.concatenate([k, k, k]),
+        np.concatenate([u[i], u[j], x[i + 1, j + 1]]),
+        np.concatenate([np.ones(len(k)), -np.ones(len(k)), np.full(len(k), n)]),
+        hi=n - 1,
+    )
+    return model, x, y
+
+
+# ----- examples: same objective on both backends, and batch throughput -----
+def course_models():
+    here = os.path.dirname(os.path.abspath(__file__))
+    capacity = [1700, 2000, 1700]
+    demand = [1700, 1000, 1500, 1200]
+    cost = [[5, 3, 2, 6], [7, 7, 8, 10], [6, 5, 3, 8]]
+    revenues = {
+        1: 127,
+        2: 83,
+        3: 165,
+        4: 96,
+        5: 112,
+        6: 88,
+        7: 135,
+        8: 141,
+        9: 117,
+        10: 94,
+    }
+    proximity_sets = [[1, 2, 4], [1, 3], [4, 5, 6], [6, 7, 8], [6, 9], [8, 10], [9, 10]]
+
+    data = pd.read_csv(os.path.join(here, "lec4", "cn.csv"))
+    data = data[(data["capital"] == "admin") | (data["capital"] == "primary")]
+    loc = data[["lat", "lng"]].values
+    dist = np.sqrt(((loc[:, None, :] - loc[None, :, :]) ** 2).sum(axis=2))
+    n = len(loc)
+    puzzle = (
+        pd.read_excel(os.path.join(here, "lec7", "sudoku_test.xlsx"), header=None)
+        .fillna(0)
+        .values
+    )
+
+    return {
+        "transportation": transportation(capacity, demand, cost)[0],
+        "store_selection": store_selection(revenues, proximity_sets)[0],
+        "pmedian": pmedian(dist, round(n * 0.2))[0],
+        "fcfl": fcfl(
+            dist, data["population"].values * 1e-5, np.full(n, 1e3), np.full(n, 3e2)
+        )[0],
+        "sudoku": sudoku(puzzle)[0],
+    }
+
+
+def compare(backends=("highs", "gurobi")):
+    """Solve every course model on each backend and check the objectives agree.
+
+    Returns {model name: {backend: Result}}.
+    """
+    report = {}
+    for name, model in course_models().items():
+        results = {b: model.solve(b) for b in backends}
+        report[name] = results
+        objs = [r.obj for r in results.values()]
+        line = ", ".join(
+            f"{b}: "
+            + ("no solution" if r.obj is None else f"{r.obj:.4f}")
+            + f" ({r.runtime:.2f} s)"
+            for b, r in results.items()
+        )
+        if len(objs) < 2:
+            verdict = ""
+        elif None in objs:
+            verdict = "DIFFERENT" if any(o is not None for o in objs) else "no solution"
+        else:
+            same = all(abs(o - objs[0]) <= 1e-6 * max(1.0, abs(objs[0])) for o in objs)
+            verdict = "same" if same else "DIFFERENT"
+        print(f"{name:<16}{line}  {verdict}".rstrip())
+    return report
+
+
+def _solve_job(args):
+    model, backend = args
+    return model.solve(backend, threads=1).obj
+
+
+def throughput(model, backend, jobs=200, workers=None):
+    """Solves per second for `jobs` copies of model over a process pool."""
+    start = time.perf_counter()
+    with ProcessPoolExecutor(workers) as pool:
+        list(pool.map(_solve_job, [(model, backend)] * jobs))
+    return jobs / (time.perf_counter() - start)
+
+
+if __name__ == "__main__":
+    try:
+        import gurobipy  # noqa: F401
+
+        backends = ("highs", "gurobi")
+    except ImportError:
+        backends = ("highs",)
+    compare(backends)
+
+    # run on a many-core worker: HiGHS is not limited by license seats
+    models = course_models()
+    for backend in backends:
+        rate = throughput(models["pmedian"], backend)
+        print(f"pmedian throughput on {backend}: {rate:.1f} solves/s")
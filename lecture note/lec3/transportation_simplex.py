@@ -0,0 +1,371 @@
+import time
+
+import numpy as np
+
+
+# ----- initial basis: Vogel's approximation method -----
+def vogel(supply, demand, cost):
+    """Return the m + n - 1 basic cells (rows, cols, flows) of a VAM solution.
+
+    supply and demand must be balanced. Each step removes exactly one row or
+    column, so the allocated cells always form a spanning tree of the
+    bipartite plant-retailer graph (degenerate cells carry zero flow).
+    """
+    m, n = cost.shape
+    s = supply.astype(float).copy()
+    d = demand.astype(float).copy()
+    row_active = np.ones(m, dtype=bool)
+    col_active = np.ones(n, dtype=bool)
+    # sorted cost order of every row / column, scanned with two pointers each
+    row_order = np.argsort(cost, axis=1).astype(np.int32)
+    col_order = np.argsort(cost, axis=0).T.astype(np.int32)
+    row_ptr = np.zeros((m, 2), dtype=np.int64)
+    col_ptr = np.zeros((n, 2), dtype=np.int64)
+    row_pen = np.zeros(m)
+    col_pen = np.zeros(n)
+
+    def advance(order, active, k, start):
+        # next active entry in order[k] at or after position start
+        line = order[k]
+        p = start
+        while p < len(line) and not active[line[p]]:
+            p += 1
+        return p
+
+    def refresh(order, ptr, pen, active, lines, line_cost):
+        for k in lines:
+            first = advance(order, active, k, ptr[k, 0])
+            second = advance(order, active, k, max(first + 1, ptr[k, 1]))
+            ptr[k] = first, second
+            c1 = line_cost(k, order[k, first])
+            if second < order.shape[1]:
+                pen[k] = line_cost(k, order[k, second]) - c1
+            else:
+                pen[k] = c1
+
+    refresh(row_order, row_ptr, row_pen, col_active, range(m), lambda i, j: cost[i, j])
+    refresh(col_order, col_ptr, col_pen, row_active, range(n), lambda j, i: cost[i, j])
+
+    rows, cols, flows = [], [], []
+    num_rows, num_cols = m, n
+    while num_rows > 1 and num_cols > 1:
+        i = np.argmax(np.where(row_active, row_pen, -np.inf))
+        j = np.argmax(np.where(col_active, col_pen, -np.inf))
+        if row_pen[i] >= col_pen[j]:
+            j = row_order[i, row_ptr[i, 0]]
+            drop_row = s[i] <= d[j]
+        else:
+            i = col_order[j, col_ptr[j, 0]]
+            drop_row = s[i] < d[j]
+        q = min(s[i], d[j])
+        rows.append(i)
+        cols.append(j)
+        flows.append(q)
+        s[i] -= q
+        d[j] -= q
+        if drop_row:
+            row_active[i] = False
+            num_rows -= 1
+            first = col_order[np.arange(n), col_ptr[:, 0]]
+            second = col_order[np.arange(n), np.minimum(col_ptr[:, 1], m - 1)]
+            touched = np.flatnonzero(col_active & ((first == i) | (second == i)))
+            refresh(
+                col_order,
+                col_ptr,
+                col_pen,
+                row_active,
+                touched,
+                lambda j, i: cost[i, j],
+            )
+        else:
+            col_active[j] = False
+            num_cols -= 1
+            first = row_order[np.arange(m), row_ptr[:, 0]]
+            second = row_order[np.arange(m), np.minimum(row_ptr[:, 1], n - 1)]
+            touched = np.flatnonzero(row_active & ((first == j) | (second == j)))
+            refresh(
+                row_order,
+                row_ptr,
+                row_pen,
+                col_active,
+                touched,
+                lambda i, j: cost[i, j],
+            )
+
+    # one line left: every remaining active cell in it is basic
+    for i in np.flatnonzero(row_active):
+        for j in np.flatnonzero(col_active):
+            q = min(s[i], d[j])
+            rows.append(i)
+            cols.append(j)
+            flows.append(q)
+            s[i] -= q
+            d[j] -= q
+    return rows, cols, flows
+
+
+# ----- network simplex on the transportation tree -----
+def network_simplex(supply, demand, cost, block_size=None, max_iter=None):
+    """Solve the balanced transportation problem min c'x over the spanning-tree basis.
+
+    Nodes 0..m-1 are plants and m..m+n-1 are retailers. The basis tree is kept in
+    flat arrays: parent, depth, arc flow to the parent, and first-child /
+    next-sibling / prev-sibling links. Entering cells are chosen by block
+    pricing on row blocks of the reduced-cost matrix. Raises RuntimeError
+    after max_iter pivots (default 100 * (m + n)).
+    """
+    m, n = cost.shape
+    N = m + n
+    if block_size is None:
+        block_size = max(1, min(m, (1 << 16) // n + 1))
+
+    rows, cols, flows = vogel(supply, demand, cost)
+
+    # build the tree from the basic cells, rooted at plant 0
+    adj = [[] for _ in range(N)]
+    for i, j, q in zip(rows, cols, flows):
+        adj[i].append((m + j, q))
+        adj[m + j].append((i, q))
+    parent = [-1] * N
+    depth = [0] * N
+    flow = [0.0] * N  # flow on the arc between a node and its parent
+    first_child = [-1] * N
+    next_sib = [-1] * N
+    prev_sib = [-1] * N
+    pot = np.zeros(N)  # u = pot[:m], v = pot[m:], with u_i + v_j = c_ij on the tree
+
+    def attach(child, par):
+        parent[child] = par
+        prev_sib[child] = -1
+        next_sib[child] = first_child[par]
+        if first_child[par] != -1:
+            prev_sib[first_child[par]] = child
+        first_child[par] = child
+
+    def detach(child):
+        par = parent[child]
+        if prev_sib[child] != -1:
+            next_sib[prev_sib[child]] = next_sib[child]
+        else:
+            first_child[par] = next_sib[child]
+        if next_sib[child] != -1:
+            prev_sib[next_sib[child]] = prev_sib[child]
+
+    seen = [False] * N
+    seen[0] = True
+    stack = [0]
+    while stack:
+        a = stack.pop()
+        for b, q in adj[a]:
+            if not seen[b]:
+                seen[b] = True
+                attach(b, a)
+                depth[b] = depth[a] + 1
+                flow[b] = q
+                if a < m:
+                    pot[b] = cost[a, b - m] - pot[a]
+                else:
+                    pot[b] = cost[b, a - m] - pot[a]
+                stack.append(b)
+
+    def subtree(root):
+        nodes = []
+        stack = [root]
+        while stack:
+            a = stack.pop()
+            nodes.append(a)
+            c = first_child[a]
+            while c != -1:
+                stack.append(c)
+                c = next_sib[c]
+        return nodes
+
+    u = pot[:m]
+    v = pot[m:]
+    eps = 1e-9 * max(1.0, float(np.abs(cost).max()))
+    start = 0
+    num_blocks = (m + block_size - 1) // block_size
+    idle = 0
+    iteration = 0
+    if max_iter is None:
+        max_iter = 100 * N
+    while idle < num_blocks:
+        # ----- pricing: most negative reduced cost in the current row block -----
+        stop = min(start + block_size, m)
+        reduced = cost[start:stop] - u[start:stop, None] - v[None, :]
+        k = reduced.argmin()
+        r = reduced.flat[k]
+        block_start = start
+        start = stop if stop < m else 0
+        if r >= -eps:
+            idle += 1
+            continue
+        idle = 0
+        if iteration >= max_iter:
+            raise RuntimeError(f"network simplex did not converge in {max_iter} pivots")
+        iteration += 1
+        i = block_start + k // n
+        j = m + k % n
+
+        # ----- cycle: walk up from both endpoints to the apex -----
+        # arcs at odd distance from their endpoint lose theta, the others gain it
+        path_i, path_j = [], []
+        a, b = i, j
+        while a != b:
+            if depth[a] >= depth[b]:
+                path_i.append(a)
+                a = parent[a]
+            else:
+                path_j.append(b)
+                b = parent[b]
+        # leaving arc: the last blocking arc when the cycle is traversed from
+        # the apex in the direction of the entering arc (down to i, over (i, j),
+        # up from j), so ties under degeneracy are broken consistently
+        theta = np.inf
+        leave, leave_side = -1, None
+        candidates = [
+            ("i", path_i[t]) for t in range((len(path_i) - 1) // 2 * 2, -1, -2)
+        ]
+        candidates += [("j", path_j[t]) for t in range(0, len(path_j), 2)]
+        for side, node in candidates:
+            if flow[node] <= theta:
+                theta = flow[node]
+                leave, leave_side = node, side
+        for path in (path_i, path_j):
+            for t, node in enumerate(path):
+                flow[node] += -theta if t % 2 == 0 else theta
+
+        # ----- re-hang the subtree cut off by the leaving arc -----
+        inner, outer = (i, j) if leave_side == "i" else (j, i)
+        path = path_i if leave_side == "i" else path_j
+        stem = path[: path.index(leave) + 1]  # inner ... leave
+        old_flow = [flow[node] for node in stem]
+        for node in stem:
+            detach(node)
+        attach(inner, outer)
+        flow[inner] = theta
+        for t in range(1, len(stem)):
+            attach(stem[t], stem[t - 1])
+            flow[stem[t]] = old_flow[t - 1]
+
+        # potentials and depths of the moved subtree
+        moved = np.array(subtree(inner))
+        if inner < m:
+            pot[moved] += np.where(moved < m, r, -r)
+        else:
+            pot[moved] += np.where(moved < m, -r, r)
+        for node in moved.tolist():
+            depth[node] = depth[parent[node]] + 1
+
+    # collect the basic cells
+    x_rows, x_cols, x_vals = [], [], []
+    for node in range(1, N):
+        a, b = node, parent[node]
+        if a >= m:
+            a, b = b, a
+        x_rows.append(a)
+        x_cols.append(b - m)
+        x_vals.append(flow[node])
+    return (
+        np.array(x_rows),
+        np.array(x_cols),
+        np.array(x_vals),
+        u.copy(),
+        v.copy(),
+        iteration,
+    )
+
+
+def solve_transportation(capacity, demand, cost):
+    """Solve min sum c[i,j] x[i,j] s.t. sum_j x[i,j] <= capacity[i], sum_i x[i,j] == demand[j].
+
+    capacity / demand / cost may be dicts keyed as in transportation.py or
+    NumPy arrays (cost of shape m x n). Excess capacity goes to a zero-cost
+    dummy retailer. Returns (x, obj, u, v): x maps basic cells to flows, u are
+    the duals of the capacity constraints (<= 0) and v of the demand
+    constraints, so the reduced cost of cell (i, j) is cost[i, j] - u[i] - v[j].
+    """
+    if isinstance(capacity, dict):
+        plant = list(capacity.keys())
+        retailer = list(demand.keys())
+        s = np.array([capacity[i] for i in plant], dtype=float)
+        d = np.array([demand[j] for j in retailer], dtype=float)
+        c = np.array([[cost[i, j] for j in retailer] for i in plant], dtype=float)
+    else:
+        s = np.asarray(capacity, dtype=float)
+        d = np.asarray(demand, dtype=float)
+        c = np.asarray(cost, dtype=float)
+        plant = list(range(len(s)))
+        retailer = list(range(len(d)))
+    n = len(d)
+
+    excess = s.sum() - d.sum()
+    if excess < 0:
+        raise ValueError("total capacity is less than total demand")
+    dummy = excess > 0
+    if dummy:
+        c = np.hstack([c, np.zeros((len(s), 1))])
+        d = np.append(d, excess)
+
+    x_rows, x_cols, x_vals, u, v, _ = network_simplex(s, d, c)
+
+    # normalise duals: slack plants have u = 0 and every u <= 0
+    shift = v[n] if dummy else -u.max()
+    u += shift
+    v -= shift
+
+    real = x_cols < n
+    x = {
+        (plant[i], retailer[j]): q
+        for i, j, q in zip(x_rows[real], x_cols[real], x_vals[real].tolist())
+    }
+    obj = float((c[x_rows, x_cols] * x_vals).sum())
+    return x, obj, dict(zip(plant, u.tolist())), dict(zip(retailer, v[:n].tolist()))
+
+
+# ----- timing against the Gurobi LP -----
+def benchmark(m=5000, n=5000, seed=0):
+    import gurobipy as gp
+
+    rng = np.random.default_rng(seed)
+    cost = rng.integers(1, 100, (m, n)).astype(float)
+    demand = rng.integers(10, 100, n).astype(float)
+    capacity = rng.multinomial(int(demand.sum() * 1.1), np.ones(m) / m).astype(float)
+
+    t0 = time.perf_counter()
+    _, obj, _, _ = solve_transportation(capacity, demand, cost)
+    t_ns = time.perf_counter() - t0
+
+    t0 = time.perf_counter()
+    mdl = gp.Model("transportation")
+    mdl.params.OutputFlag = 0
+    x = mdl.addMVar((m, n))
+    mdl.setObjective((cost * x).sum(), gp.GRB.MINIMIZE)
+    mdl.addConstr(x.sum(axis=0) == demand)
+    mdl.addConstr(x.sum(axis=1) <= capacity)
+    mdl.optimize()
+    t_grb = time.perf_counter() - t0
+
+    print(f"network simplex: obj = {obj:.0f}, {t_ns:.2f} s")
+    print(f"gurobi:          obj = {mdl.objVal:.0f}, {t_grb:.2f} s (incl. build)")
+
+
+if __name__ == "__main__":
+    # data (same instance as transportation.py)
+    plant = [1, 2, 3]
+    retailer = ["A", "B", "C", "D"]
+    capacity = dict(zip(plant, [1700, 2000, 1700]))
+    demand = dict(zip(retailer, [1700, 1000, 1500, 1200]))
+    cost_raw = [[5, 3, 2, 6], [7, 7, 8, 10], [6, 5, 3, 8]]
+    cost = {
+        (plant[i], retailer[j]): cost_raw[i][j]
+        for i in range(len(plant))
+        for j in range(len(retailer))
+    }
+
+    x, obj, u, v = solve_transportation(capacity, demand, cost)
+    for (i, j), q in sorted(x.items(), key=str):
+        print(f"transport_qty[{i},{j}] = {q:g}")
+    print("obj val =", obj)
+    print("plant duals:", u)
+    print("retailer duals:", v)
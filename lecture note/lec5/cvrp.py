@@ -1,5 +1,7 @@
+import hashlib
 import matplotlib.pyplot as plt
 import gurobipy as gp
+from snapshot import build_or_load, timings
 
 # data
 n = 20
@@ -36,26 +38,36 @@ with open('r102.txt') as f:
 c = {(i,j):round(((cx[i] - cx[j])**2 + (cy[i] - cy[j])**2)**.5, 2) for i,j in A}
 
 # model
-mdl = gp.Model('vrp')
+def build_model():
+    mdl = gp.Model('vrp')
 
-# decision variables
-x = mdl.addVars(A, vtype=gp.GRB.BINARY, name='x')
-u = mdl.addVars(N, lb=q, ub=Q, name='u')    # define u[0] but do not use, for ease to define its lb and ub
+    # decision variables
+    x = mdl.addVars(A, vtype=gp.GRB.BINARY, name='x')
+    u = mdl.addVars(N, lb=q, ub=Q, name='u')    # define u[0] but do not use, for ease to define its lb and ub
 
-# objective function
-mdl.setObjective(x.prod(c), sense=gp.GRB.MINIMIZE)
+    # objective function
+    mdl.setObjective(x.prod(c), sense=gp.GRB.MINIMIZE)
 
-# constraints: flow conservation
-mdl.addConstrs((x.sum('*', i) == 1 for i in Nc), name='inflow')
-mdl.addConstrs((x.sum(i, '*') == 1 for i in Nc), name='outflow')
-mdl.addConstr(x.sum(0, '*') <= m, name='vehicle')
+    # constraints: flow conservation
+    mdl.addConstrs((x.sum('*', i) == 1 for i in Nc), name='inflow')
+    mdl.addConstrs((x.sum(i, '*') == 1 for i in Nc), name='outflow')
+    mdl.addConstr(x.sum(0, '*') <= m, name='vehicle')
 
-# constraints: capacity & subtour elimination
-mdl.addConstrs(((x[i,j] == 1) >> (u[j] >= u[i] + q[j])
-                for i in Nc for j in Nc if i != j), name='capacity')
+    # constraints: capacity & subtour elimination
+    mdl.addConstrs(((x[i,j] == 1) >> (u[j] >= u[i] + q[j])
+                    for i in Nc for j in Nc if i != j), name='capacity')
+    return mdl
+
+# reuse the saved model (snapshots/cvrp.mps.gz) unless the data, n or the
+# source of build_model() changed (build_or_load hashes the builder into the key)
+with open('r102.txt', 'rb') as f:
+    key = hashlib.md5(f.read()).hexdigest() + f'-{n}'
+mdl, var_by_name, _ = build_or_load('cvrp', build_model, key=key)
+x = {(i,j): var_by_name[f'x[{i},{j}]'] for i,j in A}
+build_time, load_times = timings('cvrp')
+print('build time =', build_time, 'load times =', load_times)
 
 # optimize
-mdl.write('cvrp.lp')
 mdl.params.timelimit = 30
 mdl.optimize()
 
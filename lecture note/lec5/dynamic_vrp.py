@@ -0,0 +1,253 @@
+import time
+
+import numpy as np
+
+
+# ----- data (r102.txt, same layout as cvrp.py) -----
+def read_instance(filename='r102.txt'):
+    with open(filename) as f:
+        lines = f.read().splitlines()
+    m, Q = (int(v) for v in lines[4].split())
+    rows = np.array([[int(v) for v in line.split()]
+                     for line in lines[9:] if line.strip()])
+    cx, cy, q, e, l, s = rows[:, 1:7].T
+    return m, Q, cx, cy, q, e, l, s
+
+
+class DynamicRouter:
+    """Keep VRPTW routes in memory and update them as customers come and go.
+
+    Every route caches, per position, the service start time (forward) and the
+    latest start time that keeps the rest of the route feasible (backward), so
+    checking capacity Q and time windows e/l/s for an insertion is O(1) per
+    position. A MIP re-solve, warm-started from the current routes, is only
+    used when a customer cannot be inserted.
+    """
+
+    def __init__(self, m, Q, cx, cy, q, e, l, s, timelimit=30):
+        self.m = m
+        self.Q = Q
+        self.q, self.e, self.l, self.s = q, e, l, s
+        self.t = np.round(np.hypot(np.subtract.outer(cx, cx),
+                                   np.subtract.outer(cy, cy)), 2)
+        self.timelimit = timelimit
+        self.routes = []  # customers of each route, depot 0 at both ends implied
+        self.cache = []  # (nodes, start, latest, load) per route
+        self.unserved = set()
+        self.latency = []  # seconds per add / cancel update
+        self.resolves = 0
+
+    # ----- forward / backward slack arrays -----
+    def _refresh(self, r):
+        t, e, l, s = self.t, self.e, self.l, self.s
+        nodes = np.array([0] + self.routes[r] + [0])
+        k = len(nodes)
+        start = np.empty(k)
+        latest = np.empty(k)
+        start[0] = e[0]
+        for p in range(1, k):
+            a, b = nodes[p - 1], nodes[p]
+            start[p] = max(e[b], start[p - 1] + s[a] + t[a, b])
+        latest[-1] = l[0]
+        for p in range(k - 2, -1, -1):
+            a, b = nodes[p], nodes[p + 1]
+            latest[p] = min(l[a], latest[p + 1] - t[a, b] - s[a])
+        self.cache[r] = (nodes, start, latest, self.q[nodes].sum())
+
+    def _best_insertion(self, c, skip=None):
+        """Cheapest feasible (delta, route, position) for customer c."""
+        t, e, l, s = self.t, self.e, self.l, self.s
+        best = (np.inf, None, None)
+        for r, (nodes, start, latest, load) in enumerate(self.cache):
+            if r == skip or load + self.q[c] > self.Q:
+                continue
+            a, b = nodes[:-1], nodes[1:]
+            arrive = np.maximum(e[c], start[:-1] + s[a] + t[a, c])
+            ok = (arrive <= l[c]) & (arrive + s[c] + t[c, b] <= latest[1:])
+            if not ok.any():
+                continue
+            delta = np.where(ok, t[a, c] + t[c, b] - t[a, b], np.inf)
+            p = delta.argmin()
+            if delta[p] < best[0]:
+                best = (delta[p], r, p)
+        return best
+
+    def _insert_at(self, c, r, p):
+        self.routes[r].insert(p, c)
+        self._refresh(r)
+
+    def _new_route(self, c):
+        if len(self.routes) >= self.m:
+            return False
+        t, e, l, s = self.t, self.e, self.l, self.s
+        arrive = max(e[c], e[0] + t[0, c])
+        if arrive > l[c] or arrive + s[c] + t[c, 0] > l[0] or self.q[c] > self.Q:
+            return False
+        self.routes.append([c])
+        self.cache.append(None)
+        self._refresh(len(self.routes) - 1)
+        return True
+
+    # ----- local search repair: relocate customers of touched routes -----
+    def _relocate(self, touched, max_moves=50):
+        t = self.t
+        moves = 0
+        touched = set(touched)
+        while touched and moves < max_moves:
+            r = touched.pop()
+            if r >= len(self.routes):
+                continue
+            nodes = self.cache[r][0]
+            for p in range(1, len(nodes) - 1):
+                a, c, b = nodes[p - 1], nodes[p], nodes[p + 1]
+                gain = t[a, c] + t[c, b] - t[a, b]
+                delta, r2, p2 = self._best_insertion(c, skip=r)
+                if delta < gain - 1e-6:
+                    self.routes[r].remove(c)
+                    self._refresh(r)
+                    self._insert_at(c, r2, p2)
+                    touched.update((r, r2))
+                    moves += 1
+                    break
+        self._drop_empty()
+
+    def _drop_empty(self):
+        keep = [r for r in range(len(self.routes)) if self.routes[r]]
+        self.routes = [self.routes[r] for r in keep]
+        self.cache = [self.cache[r] for r in keep]
+
+    # ----- updates -----
+    def _route_of(self, c):
+        for r, route in enumerate(self.routes):
+            if c in route:
+                return r
+        return None
+
+    def add(self, c):
+        start = time.perf_counter()
+        c = int(c)
+        if c in self.unserved or self._route_of(c) is not None:
+            raise ValueError(f'customer {c} is already in the plan')
+        delta, r, p = self._best_insertion(c)
+        if r is not None:
+            self._insert_at(c, r, p)
+            self._relocate([r])
+        elif not self._new_route(c):
+            self.unserved.add(c)
+            self.resolve()
+        self.latency.append(time.perf_counter() - start)
+
+    def cancel(self, c):
+        start = time.perf_counter()
+        c = int(c)
+        if c in self.unserved:
+            self.unserved.discard(c)
+        else:
+            r = self._route_of(c)
+            if r is None:
+                raise KeyError(f'customer {c} is not in the plan')
+            self.routes[r].remove(c)
+            if self.routes[r]:
+                self._refresh(r)
+                self._relocate([r])
+            else:
+                self._drop_empty()
+        self.latency.append(time.perf_counter() - start)
+
+    def cost(self):
+        return sum(self.t[n[:-1], n[1:]].sum() for n, _, _, _ in self.cache)
+
+    # ----- warm-started MIP over all current customers -----
+    def resolve(self):
+        import gurobipy as gp
+
+        self.resolves += 1
+        t, q, e, l, s, Q = self.t, self.q, self.e, self.l, self.s, self.Q
+        routed = set(c for route in self.routes for c in route)
+        Nc = sorted(routed | self.unserved)
+        N = [0] + Nc
+        A = [(i, j) for i in N for j in N if i != j]
+        bonus = t.max() * (len(N) + self.m) + 1
+
+        mdl = gp.Model('dvrp')
+        mdl.params.OutputFlag = 0
+        x = mdl.addVars(A, vtype=gp.GRB.BINARY, name='x')
+        # customer served; confirmed (already routed) customers must stay served
+        v = mdl.addVars(Nc, lb=[int(c in routed) for c in Nc],
+                        vtype=gp.GRB.BINARY, name='v')
+        u = mdl.addVars(N, lb=0, ub=Q, name='u')
+        w = mdl.addVars(N, lb=[e[i] for i in N], ub=[l[i] for i in N], name='w')
+
+        # serve as many customers as possible first, then minimise distance
+        mdl.setObjective(x.prod({a: t[a] for a in A}) - bonus * v.sum(),
+                         sense=gp.GRB.MINIMIZE)
+        mdl.addConstrs((x.sum('*', i) == v[i] for i in Nc), name='inflow')
+        mdl.addConstrs((x.sum(i, '*') == v[i] for i in Nc), name='outflow')
+        mdl.addConstr(x.sum(0, '*') <= self.m, name='vehicle')
+        mdl.addConstrs(((x[i, j] == 1) >> (u[j] >= u[i] + q[j])
+                        for i in N for j in Nc if i != j), name='capacity')
+        mdl.addConstrs(((x[i, j] == 1) >> (w[j] >= w[i] + s[i] + t[i, j])
+                        for i in N for j in Nc if i != j), name='time')
+        mdl.addConstrs(((x[i, 0] == 1) >> (w[i] + s[i] + t[i, 0] <= l[0])
+                        for i in Nc), name='return')
+
+        # warm start from the current routes
+        for a in A:
+            x[a].Start = 0
+        for c in Nc:
+            v[c].Start = 0
+            u[c].Start = q[c]
+            w[c].Start = e[c]
+        for nodes, start, _, _ in self.cache:
+            for i, j in zip(nodes[:-1], nodes[1:]):
+                x[i, j].Start = 1
+            load = np.cumsum(q[nodes])
+            for p in range(1, len(nodes) - 1):
+                c = nodes[p]
+                v[c].Start = 1
+                u[c].Start = load[p]
+                w[c].Start = start[p]
+        u[0].Start = 0
+        w[0].Start = e[0]
+
+        mdl.params.timelimit = self.timelimit
+        mdl.optimize()
+        if mdl.SolCount == 0:
+            # the current routes are a feasible solution, so this is a bug
+            raise RuntimeError(f'VRP re-solve found no solution '
+                               f'(status {mdl.status}); warm start rejected?')
+
+        succ = {i: j for (i, j) in A if x[i, j].x > .5}
+        self.routes = []
+        for (i, j) in A:
+            if i == 0 and x[i, j].x > .5:
+                route = []
+                while j != 0:
+                    route.append(j)
+                    j = succ[j]
+                self.routes.append(route)
+        self.cache = [None] * len(self.routes)
+        for r in range(len(self.routes)):
+            self._refresh(r)
+        self.unserved = {c for c in Nc if v[c].x < .5}
+
+
+if __name__ == '__main__':
+    m, Q, cx, cy, q, e, l, s = read_instance()
+    router = DynamicRouter(m, Q, cx, cy, q, e, l, s)
+
+    # dispatch day: customers call in one by one, some cancel later
+    rng = np.random.default_rng(0)
+    arrivals = rng.permutation(np.arange(1, len(q)))
+    served = []
+    for c in arrivals:
+        router.add(c)
+        served.append(c)
+        if rng.random() < 0.1:
+            router.cancel(served.pop(rng.integers(len(served))))
+
+    lat = np.array(router.latency) * 1e3
+    print('routes =', len(router.routes), 'cost =', round(router.cost(), 2))
+    print('unserved =', sorted(router.unserved), 'MIP re-solves =', router.resolves)
+    print(f'latency per update: mean {lat.mean():.2f} ms, '
+          f'p95 {np.percentile(lat, 95):.2f} ms, max {lat.max():.2f} ms')
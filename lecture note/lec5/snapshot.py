@@ -0,0 +1,106 @@
+import hashlib
+import inspect
+import json
+import os
+import time
+
+import gurobipy as gp
+
+# ----- snapshot store for built models -----
+# A snapshot is <name>.mps.gz (the model written by Gurobi, gzip-compressed,
+# variable and constraint names included), a small <name>.json holding the key
+# the model was built from and the build time, and <name>.loads with one load
+# time per line (appended, never rewritten).
+
+
+def _paths(name, directory):
+    base = os.path.join(directory, name)
+    return base + ".mps.gz", base + ".json", base + ".loads"
+
+
+def _by_name(model):
+    var_by_name = dict(zip(model.getAttr("VarName", model.getVars()), model.getVars()))
+    constrs = model.getConstrs()
+    constr_by_name = dict(zip(model.getAttr("ConstrName", constrs), constrs))
+    return var_by_name, constr_by_name
+
+
+def builder_key(build, key=None):
+    """Key that changes with the data key and with the source of build()."""
+    try:
+        code = inspect.getsource(build).encode()
+    except (OSError, TypeError):
+        code = build.__code__.co_code
+    return f"{key}-{hashlib.md5(code).hexdigest()}"
+
+
+def save_snapshot(model, name, directory="snapshots", key=None, build_time=None):
+    os.makedirs(directory, exist_ok=True)
+    mps_file, meta_file, loads_file = _paths(name, directory)
+    model.update()
+    model.write(mps_file)
+    with open(meta_file, "w") as f:
+        json.dump({"key": key, "build_time": build_time}, f)
+    if os.path.exists(loads_file):
+        os.remove(loads_file)
+
+
+def load_snapshot(name, directory="snapshots", env=None):
+    """Read a saved model; returns (model, vars by name, constrs by name)."""
+    mps_file, _, loads_file = _paths(name, directory)
+    start = time.perf_counter()
+    model = gp.read(mps_file, env) if env is not None else gp.read(mps_file)
+    var_by_name, constr_by_name = _by_name(model)
+    with open(loads_file, "a") as f:
+        f.write(f"{time.perf_counter() - start}\n")
+    return model, var_by_name, constr_by_name
+
+
+def patch(model, var_by_name, constr_by_name, lb=None, ub=None, obj=None, rhs=None):
+    """Change only the given bounds, objective coefficients and right-hand sides.
+
+    Each argument maps a variable (lb, ub, obj) or constraint (rhs) name to its
+    new value.
+    """
+    for attr, values, lookup in (
+        ("LB", lb, var_by_name),
+        ("UB", ub, var_by_name),
+        ("Obj", obj, var_by_name),
+        ("RHS", rhs, constr_by_name),
+    ):
+        if values:
+            model.setAttr(attr, [lookup[k] for k in values], list(values.values()))
+    model.update()
+
+
+def build_or_load(name, build, key=None, directory="snapshots", env=None):
+    """Load the snapshot `name` if it was built from the same key and the same
+    build() source, otherwise call build() (which returns a Gurobi model),
+    save it and return it.
+
+    Returns (model, vars by name, constrs by name).
+    """
+    key = builder_key(build, key)
+    mps_file, meta_file, _ = _paths(name, directory)
+    if os.path.exists(mps_file) and os.path.exists(meta_file):
+        with open(meta_file) as f:
+            if json.load(f)["key"] == key:
+                return load_snapshot(name, directory, env)
+    start = time.perf_counter()
+    model = build()
+    model.update()
+    build_time = time.perf_counter() - start
+    save_snapshot(model, name, directory, key, build_time)
+    return (model,) + _by_name(model)
+
+
+def timings(name, directory="snapshots"):
+    """Build time and load times (seconds) recorded for a snapshot."""
+    _, meta_file, loads_file = _paths(name, directory)
+    with open(meta_file) as f:
+        build_time = json.load(f)["build_time"]
+    load_times = []
+    if os.path.exists(loads_file):
+        with open(loads_file) as f:
+            load_times = [float(line) for line in f if line.strip()]
+    return build_time, load_times
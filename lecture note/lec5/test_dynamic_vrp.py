@@ -0,0 +1,42 @@
+import os
+
+import pytest
+
+from dynamic_vrp import DynamicRouter, read_instance
+
+here = os.path.dirname(os.path.abspath(__file__))
+
+
+def make_router(m=2, timelimit=5):
+    _, Q, cx, cy, q, e, l, s = read_instance(os.path.join(here, 'r102.txt'))
+    return DynamicRouter(m, Q, cx, cy, q, e, l, s, timelimit=timelimit)
+
+
+def feasible(router):
+    return all((start <= router.l[nodes]).all() and load <= router.Q
+               for nodes, start, _, load in router.cache)
+
+
+def test_add_twice_and_cancel_unknown():
+    router = make_router()
+    router.add(1)
+    with pytest.raises(ValueError):
+        router.add(1)
+    with pytest.raises(KeyError):
+        router.cancel(2)
+    router.cancel(1)
+    assert router.routes == []
+
+
+def test_resolve_keeps_confirmed_customers():
+    pytest.importorskip('gurobipy')
+    router = make_router()
+    for c in range(1, 14):  # two vehicles: later customers force re-solves
+        confirmed = {i for route in router.routes for i in route}
+        resolves = router.resolves
+        router.add(c)  # raises if the warm start is rejected
+        if router.resolves > resolves:
+            routed = {i for route in router.routes for i in route}
+            assert confirmed <= routed
+            assert feasible(router)
+    assert router.resolves > 0
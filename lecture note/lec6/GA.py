@@ -0,0 +1,259 @@
+import math
+import os
+import random
+import time
+from multiprocessing import Pool
+
+import numpy as np
+import pandas as pd
+
+pop_size = 200  # 种群规模
+generations = 500  # 迭代代数
+crossover_rate = 0.9  # 交叉概率
+mutation_rate = 0.2  # 变异概率
+elite_size = 10  # 精英保留个数
+tournament_size = 3  # 锦标赛选择规模
+
+
+# ==========================================
+# 读取城市坐标：city_location.txt（x y 两列）或 cn.csv（lat, lng）
+def load_location(filename, capital_only=False):
+    if filename.endswith(".csv"):
+        data = pd.read_csv(filename)
+        if capital_only:
+            data = data[(data["capital"] == "admin") | (data["capital"] == "primary")]
+        return data[["lat", "lng"]].values.astype(float)
+    return np.loadtxt(filename)
+
+
+# 对称矩阵，两个城市之间的距离（一次广播计算）
+def distance_p2p_mat(location):
+    diff = location[:, None, :] - location[None, :, :]
+    return np.sqrt((diff**2).sum(axis=2))
+
+
+# 计算整个种群（pop × n 的整数矩阵）的路径长度：一次 gather 完成
+def cal_population(dis_mat, population):
+    return dis_mat[population, np.roll(population, -1, axis=1)].sum(axis=1)
+
+
+# 多进程评估：每个进程只保存一份距离矩阵
+_worker_dis_mat = None
+
+
+def _init_worker(dis_mat):
+    global _worker_dis_mat
+    _worker_dis_mat = dis_mat
+
+
+def _eval_chunk(chunk):
+    return cal_population(_worker_dis_mat, chunk)
+
+
+def cal_population_parallel(pool, population, processes):
+    chunks = np.array_split(population, processes)
+    return np.concatenate(pool.map(_eval_chunk, chunks))
+
+
+# ==========================================
+# 初始种群：每行是一个随机排列
+def init_population(rng, size, num_city):
+    return rng.random((size, num_city)).argsort(axis=1)
+
+
+# 锦标赛选择：一次抽出所有参赛者，返回胜者下标
+def tournament_select(rng, fitness, size):
+    contestants = rng.integers(0, len(fitness), (size, tournament_size))
+    winner = fitness[contestants].argmin(axis=1)
+    return contestants[np.arange(size), winner]
+
+
+# 顺序交叉（OX）：子代保留父代1的 [a, b) 片段，其余位置按父代2的顺序填充
+def order_crossover(rng, parent1, parent2):
+    size, num_city = parent1.shape
+    rows = np.arange(size)[:, None]
+    cut = np.sort(rng.integers(0, num_city + 1, (size, 2)), axis=1)
+    pos = np.arange(num_city)[None, :]
+    keep = (pos >= cut[:, :1]) & (pos < cut[:, 1:])
+    # kept[r, city] 表示城市 city 是否已在子代 r 的片段中
+    kept = np.zeros((size, num_city), dtype=bool)
+    kept[np.broadcast_to(rows, keep.shape)[keep], parent1[keep]] = True
+    child = np.where(keep, parent1, 0)
+    # 按行优先展开后两边每行的元素个数相同，顺序也一致
+    child[~keep] = parent2[~kept[rows, parent2]]
+    return child
+
+
+# 边重组交叉（ERX）：优先选择邻接表中剩余邻居最少的城市
+def edge_recombination_crossover(rng, parent1, parent2):
+    size, num_city = parent1.shape
+    rows = np.arange(size)[:, None]
+    # 邻接表：每个城市在两个父代中的前驱和后继（pop × n × 4），整批一次构建
+    adj = np.empty((size, num_city, 4), dtype=parent1.dtype)
+    for k, p in enumerate((parent1, parent2)):
+        adj[rows, p, 2 * k] = np.roll(p, 1, axis=1)
+        adj[rows, p, 2 * k + 1] = np.roll(p, -1, axis=1)
+    adj = adj.tolist()
+    children = np.empty_like(parent1)
+    for r in range(size):
+        neighbors = [set(row) for row in adj[r]]
+        unvisited = set(range(num_city))
+        current = int(parent1[r, 0])
+        child = []
+        while True:
+            child.append(current)
+            unvisited.discard(current)
+            for c in neighbors[current]:
+                neighbors[c].discard(current)
+            if not unvisited:
+                break
+            if neighbors[current]:
+                current = min(neighbors[current], key=lambda c: len(neighbors[c]))
+            else:
+                current = tuple(unvisited)[rng.integers(len(unvisited))]
+        children[r] = child
+    return children
+
+
+# 倒位变异（inversion）：对选中的行把 [i, j] 片段整体反转，全部以下标运算完成
+def inversion_mutation(rng, population, rate):
+    size, num_city = population.shape
+    mutate = rng.random(size) < rate
+    cut = np.sort(rng.integers(0, num_city, (size, 2)), axis=1)
+    cut[~mutate] = 0
+    i, j = cut[:, :1], cut[:, 1:]
+    pos = np.arange(num_city)[None, :]
+    idx = np.where((pos >= i) & (pos <= j), i + j - pos, pos)
+    return np.take_along_axis(population, idx, axis=1)
+
+
+# ==========================================
+def genetic_algorithm(
+    dis_mat, crossover="ox", processes=1, seed=None, time_limit=None, verbose=False
+):
+    rng = np.random.default_rng(seed)
+    num_city = len(dis_mat)
+    crossovers = {"ox": order_crossover, "erx": edge_recombination_crossover}
+    if crossover not in crossovers:
+        raise ValueError(f"crossover must be 'ox' or 'erx', got {crossover!r}")
+    cross = crossovers[crossover]
+    pool = (
+        Pool(processes, initializer=_init_worker, initargs=(dis_mat,))
+        if processes > 1
+        else None
+    )
+
+    def evaluate(population):
+        if pool is None:
+            return cal_population(dis_mat, population)
+        return cal_population_parallel(pool, population, processes)
+
+    start = time.perf_counter()
+    population = init_population(rng, pop_size, num_city)
+    fitness = evaluate(population)
+    history = []
+    try:
+        for gen in range(generations):
+            # 精英保留
+            elite = population[np.argsort(fitness)[:elite_size]]
+            # 选择
+            num_child = pop_size - elite_size
+            parent1 = population[tournament_select(rng, fitness, num_child)]
+            parent2 = population[tournament_select(rng, fitness, num_child)]
+            # 交叉：不交叉的行直接复制父代1
+            do_cross = rng.random(num_child) < crossover_rate
+            children = parent1.copy()
+            if do_cross.any():
+                children[do_cross] = cross(rng, parent1[do_cross], parent2[do_cross])
+            # 变异
+            children = inversion_mutation(rng, children, mutation_rate)
+            population = np.vstack([elite, children])
+            fitness = evaluate(population)
+            history.append(fitness.min())
+            if verbose and gen % 50 == 0:
+                print(f"gen {gen}: best = {fitness.min():.2f}")
+            if time_limit is not None and time.perf_counter() - start > time_limit:
+                break
+    finally:
+        if pool is not None:
+            pool.close()
+            pool.join()
+
+    best = fitness.argmin()
+    return population[best].tolist(), fitness[best], history
+
+
+# ==========================================
+# 与 SA.py 相同的模拟退火（参数、邻域、降温方式一致），但作用于给定的距离矩阵
+def simulated_annealing(
+    dis_mat, initial_t=120, lowest_t=0.001, M=150, iteration=500, seed=None
+):
+    rnd = random.Random(seed)
+    num_city = len(dis_mat)
+    d = dis_mat.tolist()
+
+    def cal_newpath(path):
+        return sum(d[path[j - 1]][path[j]] for j in range(num_city))  # 含回家
+
+    path = list(range(num_city))
+    dis = cal_newpath(path)
+    t_current = initial_t
+    while t_current > lowest_t:
+        count_m = 0
+        count_iter = 0
+        while count_m < M and count_iter < iteration:
+            i, j = rnd.sample(range(num_city), 2)  # 任意交换两个城市的位置
+            path_new = path.copy()
+            path_new[i], path_new[j] = path_new[j], path_new[i]
+            dis_delta = cal_newpath(path_new) - dis
+            if dis_delta < 0 or math.exp(-dis_delta / t_current) > rnd.random():
+                path = path_new
+                dis = dis + dis_delta
+            else:
+                count_m = count_m + 1
+            count_iter = count_iter + 1
+        t_current = 0.99 * t_current
+    return path, dis
+
+
+# 与模拟退火比较：同一实例上的路径长度与耗时（每秒解质量）
+def benchmark(filename="city_location.txt", repeat=5):
+    if not os.path.isabs(filename):  # 相对路径以本文件所在目录为准
+        filename = os.path.join(os.path.dirname(os.path.abspath(__file__)), filename)
+    dis_mat = distance_p2p_mat(load_location(filename))
+    results = {"SA": [], "GA-OX": [], "GA-ERX": []}
+    for r in range(repeat):
+        t0 = time.perf_counter()
+        _, dis = simulated_annealing(dis_mat, seed=r)
+        results["SA"].append((dis, time.perf_counter() - t0))
+        for name, cross in (("GA-OX", "ox"), ("GA-ERX", "erx")):
+            t0 = time.perf_counter()
+            _, dis, _ = genetic_algorithm(dis_mat, crossover=cross, seed=r)
+            results[name].append((dis, time.perf_counter() - t0))
+    print(f"\n{'method':<8}{'best':>10}{'mean':>10}{'time/s':>10}{'len*s':>12}")
+    for name, res in results.items():
+        dis = np.array([d for d, _ in res])
+        sec = np.array([t for _, t in res])
+        # len*s 越小越好：同样的路径长度所需时间更少
+        print(
+            f"{name:<8}{dis.min():>10.2f}{dis.mean():>10.2f}"
+            f"{sec.mean():>10.3f}{(dis * sec).mean():>12.2f}"
+        )
+
+
+if __name__ == "__main__":
+    location = load_location("city_location.txt")
+    dis_mat = distance_p2p_mat(location)
+    path_min, dis_min, _ = genetic_algorithm(dis_mat, seed=0)
+    print("最短距离：", dis_min)
+    print("最短路径：", path_min)
+
+    # 大规模实例：cn.csv 全部城市，多进程评估，限时 60 秒
+    location = load_location("../lec4/cn.csv")
+    dis_mat = distance_p2p_mat(location)
+    _, dis_min, _ = genetic_algorithm(
+        dis_mat, processes=4, seed=0, time_limit=60, verbose=True
+    )
+    print("cn.csv 最短距离：", dis_min)
+
+    benchmark()
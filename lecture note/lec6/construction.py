@@ -0,0 +1,188 @@
+import heapq
+import time
+
+import numpy as np
+
+from GA import distance_p2p_mat, load_location
+
+
+# ==========================================
+# 路径长度（闭合路径，首尾同为起点）
+def tour_length(tour, distance_matrix):
+    tour = np.asarray(tour)
+    return distance_matrix[tour[:-1], tour[1:]].sum()
+
+
+# 由后继数组 succ 还原闭合路径
+def succ_to_tour(succ, start=0):
+    tour = [start]
+    city = succ[start]
+    while city != start:
+        tour.append(city)
+        city = succ[city]
+    tour.append(start)
+    return tour
+
+
+# 1. 最近邻法：已访问城市的距离用 inf 屏蔽，每步一次 argmin
+def nearest_neighbor_tsp(distance_matrix, start=0):
+    n = len(distance_matrix)
+    penalty = np.zeros(n)
+    tour = [start]
+    penalty[start] = np.inf
+    current = start
+    for _ in range(n - 1):
+        current = int(np.argmin(distance_matrix[current] + penalty))
+        tour.append(current)
+        penalty[current] = np.inf
+    tour.append(start)  # 返回起点
+    return tour
+
+
+# ==========================================
+# 插入法的公共部分：路径用后继数组 succ 表示，插入 O(1)
+class _Tour:
+    def __init__(self, distance_matrix, a, b):
+        n = len(distance_matrix)
+        self.d = distance_matrix
+        self.succ = np.full(n, -1)
+        self.succ[a], self.succ[b] = b, a
+        self.nodes = np.empty(n, dtype=int)  # 已在路径中的城市（前 size 个）
+        self.nodes[:2] = a, b
+        self.size = 2
+        self.unvisited = np.ones(n, dtype=bool)
+        self.unvisited[[a, b]] = False
+
+    # 城市 c 插入到每条边 (i, succ[i]) 的增量，向量化计算
+    def insertion_costs(self, c):
+        i = self.nodes[: self.size]
+        j = self.succ[i]
+        return i, self.d[i, c] + self.d[c, j] - self.d[i, j]
+
+    def cheapest_position(self, c):
+        i, cost = self.insertion_costs(c)
+        k = cost.argmin()
+        return int(i[k]), cost[k]
+
+    def insert(self, c, i):
+        self.succ[c] = self.succ[i]
+        self.succ[i] = c
+        self.nodes[self.size] = c
+        self.size += 1
+        self.unvisited[c] = False
+
+
+def _initial_pair(distance_matrix):
+    return 0, int(np.argmin(distance_matrix[0, 1:]) + 1)
+
+
+# 2. 最便宜插入法：堆中缓存每个城市的最佳插入边，只更新受新边影响的城市
+def cheapest_insertion_tsp(distance_matrix):
+    d = distance_matrix
+    n = len(d)
+    a, b = _initial_pair(d)
+    tour = _Tour(d, a, b)
+    if n <= 2:
+        return succ_to_tour(tour.succ)
+
+    # best_cost[c], best_edge[c], best_next[c]：城市 c 当前最佳插入边 (i, j) 及增量
+    cities = np.flatnonzero(tour.unvisited)
+    cost_ab = d[a, cities] + d[cities, b] - d[a, b]
+    cost_ba = d[b, cities] + d[cities, a] - d[b, a]
+    best_cost = np.full(n, np.inf)
+    best_edge = np.full(n, -1)
+    best_next = np.full(n, -1)
+    best_cost[cities] = np.minimum(cost_ab, cost_ba)
+    best_edge[cities] = np.where(cost_ab <= cost_ba, a, b)
+    best_next[cities] = np.where(cost_ab <= cost_ba, b, a)
+    heap = list(
+        zip(
+            best_cost[cities].tolist(),
+            cities.tolist(),
+            best_edge[cities].tolist(),
+            best_next[cities].tolist(),
+        )
+    )
+    heapq.heapify(heap)
+
+    while heap:
+        cost, c, i, j = heapq.heappop(heap)
+        if not tour.unvisited[c] or i != best_edge[c] or j != best_next[c]:
+            continue  # 已插入或已被更好的边取代
+        if tour.succ[i] != j:
+            # 缓存的边已被拆开：重新计算该城市的最佳位置
+            i, cost = tour.cheapest_position(c)
+            j = int(tour.succ[i])
+            best_cost[c], best_edge[c], best_next[c] = cost, i, j
+            heapq.heappush(heap, (cost, c, i, j))
+            continue
+        tour.insert(c, i)
+
+        # 新边 (i, c) 和 (c, j)：只更新能因此变得更便宜的城市
+        rest = np.flatnonzero(tour.unvisited)
+        if len(rest) == 0:
+            break
+        cost_ic = d[i, rest] + d[rest, c] - d[i, c]
+        cost_cj = d[c, rest] + d[rest, j] - d[c, j]
+        new_cost = np.minimum(cost_ic, cost_cj)
+        better = new_cost < best_cost[rest]
+        r = rest[better]
+        use_ic = cost_ic[better] <= cost_cj[better]
+        best_cost[r] = new_cost[better]
+        best_edge[r] = np.where(use_ic, i, c)
+        best_next[r] = np.where(use_ic, c, j)
+        for entry in zip(
+            best_cost[r].tolist(),
+            r.tolist(),
+            best_edge[r].tolist(),
+            best_next[r].tolist(),
+        ):
+            heapq.heappush(heap, entry)
+    return succ_to_tour(tour.succ)
+
+
+# 3. 最远插入法：每次选离当前路径最远的城市，插在最便宜的位置
+def farthest_insertion_tsp(distance_matrix):
+    d = distance_matrix
+    a, b = _initial_pair(d)
+    tour = _Tour(d, a, b)
+    dist_to_tour = np.minimum(d[a], d[b])  # 每个城市到路径的最近距离
+    dist_to_tour[~tour.unvisited] = -np.inf
+    for _ in range(len(d) - 2):
+        c = int(np.argmax(dist_to_tour))
+        i, _ = tour.cheapest_position(c)
+        tour.insert(c, i)
+        dist_to_tour = np.minimum(dist_to_tour, d[c])
+        dist_to_tour[c] = -np.inf
+    return succ_to_tour(tour.succ)
+
+
+# 4. 随机插入法：按随机顺序选城市，插在最便宜的位置
+def random_insertion_tsp(distance_matrix, seed=None):
+    d = distance_matrix
+    rng = np.random.default_rng(seed)
+    a, b = _initial_pair(d)
+    tour = _Tour(d, a, b)
+    for c in rng.permutation(np.flatnonzero(tour.unvisited)).tolist():
+        i, _ = tour.cheapest_position(c)
+        tour.insert(c, i)
+    return succ_to_tour(tour.succ)
+
+
+# ==========================================
+if __name__ == "__main__":
+    # cn.csv 全部城市
+    location = load_location("../lec4/cn.csv")
+    distance_matrix = distance_p2p_mat(location)
+    print("城市数:", len(distance_matrix))
+    for name, heuristic in (
+        ("最近邻法", nearest_neighbor_tsp),
+        ("最便宜插入法", cheapest_insertion_tsp),
+        ("最远插入法", farthest_insertion_tsp),
+        ("随机插入法", random_insertion_tsp),
+    ):
+        t0 = time.perf_counter()
+        tour = heuristic(distance_matrix)
+        sec = time.perf_counter() - t0
+        length = tour_length(tour, distance_matrix)
+        print(f"{name}: 长度 {length:.2f}, 用时 {sec:.3f} 秒")
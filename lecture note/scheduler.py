@@ -0,0 +1,203 @@
+import os
+import time
+from collections import namedtuple
+from concurrent.futures import FIRST_COMPLETED, ProcessPoolExecutor, wait
+
+import numpy as np
+
+import backend
+
+# ----- concurrent scheduler for many small independent solves -----
+# A job is a builder from backend.py plus its arguments. Workers build and
+# solve the model themselves, each worker process keeps one Gurobi
+# environment for all its jobs, and results are yielded as soon as they are
+# ready. Jobs that could not start before the time budget ran out come back
+# with status "skipped", jobs whose builder or solver raised with status
+# "error" and the exception in `error`; one bad job never stops the batch.
+
+Job = namedtuple("Job", ["name", "build", "args", "time_limit"], defaults=[None])
+JobResult = namedtuple(
+    "JobResult",
+    ["name", "status", "obj", "x", "runtime", "threads", "worker", "error"],
+    defaults=[None],
+)
+
+_env = None  # one Gurobi environment per worker process
+
+
+def _init_worker(solver):
+    global _env
+    if solver == "gurobi":
+        import gurobipy as gp
+
+        _env = gp.Env(params={"OutputFlag": 0})
+
+
+def _run(job, solver, threads, time_limit, deadline=None):
+    if deadline is not None:  # the job may have waited in the queue
+        left = deadline - time.time()
+        if left <= 0:
+            return JobResult(job.name, "skipped", None, None, 0.0, 0, os.getpid())
+        time_limit = left if time_limit is None else min(time_limit, left)
+    if solver != "gurobi":
+        threads = 1  # HiGHS (scipy.optimize.milp) always solves single-threaded
+    model = job.build(*job.args)
+    if isinstance(model, tuple):  # builders return (model, variables...)
+        model = model[0]
+    res = model.solve(solver, time_limit=time_limit, threads=threads, env=_env)
+    return JobResult(
+        job.name, res.status, res.obj, res.x, res.runtime, threads, os.getpid()
+    )
+
+
+class SolveScheduler:
+    """Run a queue of jobs over a process pool under a global core budget.
+
+    Each of the `workers` processes gets cores // workers solver threads.
+    With a wall-clock `time_budget`, every job is given an equal share of the
+    worker time left when it is dispatched, split over the jobs still queued
+    and the ones running, capped by its own time_limit and by the end of the
+    budget. Once the budget is used up no further job is started.
+    """
+
+    def __init__(self, solver="highs", cores=None, workers=None, time_budget=None):
+        self.solver = solver
+        self.cores = cores or os.cpu_count()
+        self.workers = min(workers or self.cores, self.cores)
+        self.threads = max(1, self.cores // self.workers)
+        self.time_budget = time_budget
+        self.stats = {}
+
+    def _time_limit(self, job, unfinished_jobs, elapsed):
+        """Time limit for a job dispatched now; None when the budget is used up."""
+        if self.time_budget is None:
+            return job.time_limit
+        left = self.time_budget - elapsed
+        if left <= 0:
+            return None
+        share = min(left * self.workers / max(unfinished_jobs, 1), left)
+        return share if job.time_limit is None else min(share, job.time_limit)
+
+    def run(self, jobs):
+        """Yield a JobResult for every job, in completion order."""
+        jobs = list(jobs)
+        queue = iter(jobs)
+        remaining = len(jobs)
+        busy = 0.0  # solver seconds x threads
+        time_limited, no_solution, failed, skipped = [], [], [], []
+        start = time.perf_counter()
+        deadline = None if self.time_budget is None else time.time() + self.time_budget
+        with ProcessPoolExecutor(
+            self.workers, initializer=_init_worker, initargs=(self.solver,)
+        ) as pool:
+            running = {}  # future -> job
+
+            def submit():
+                for job in queue:
+                    elapsed = time.perf_counter() - start
+                    limit = self._time_limit(job, remaining, elapsed)
+                    if limit is None and self.time_budget is not None:
+                        # budget used up: start nothing more
+                        skipped.append(
+                            JobResult(job.name, "skipped", None, None, 0.0, 0, None)
+                        )
+                        continue
+                    future = pool.submit(
+                        _run, job, self.solver, self.threads, limit, deadline
+                    )
+                    running[future] = job
+                    return
+
+            # keep two jobs per worker in flight so no worker waits on the parent
+            for _ in range(2 * self.workers):
+                submit()
+            while running:
+                done, _ = wait(running, return_when=FIRST_COMPLETED)
+                for future in done:
+                    job = running.pop(future)
+                    remaining -= 1
+                    try:
+                        result = future.result()
+                    except Exception as e:  # builder/solver raised, or worker died
+                        result = JobResult(
+                            job.name, "error", None, None, 0.0, 0, None, error=e
+                        )
+                    busy += result.runtime * result.threads
+                    if result.status == "skipped":
+                        skipped.append(result)
+                    elif result.status == "error":
+                        failed.append(result.name)
+                    elif result.obj is None:
+                        no_solution.append(result.name)
+                    elif result.status != "optimal":
+                        time_limited.append(result.name)
+                    submit()
+                    if result.status != "skipped":
+                        yield result
+        yield from skipped
+
+        wall = time.perf_counter() - start
+        solved = (
+            len(jobs)
+            - len(time_limited)
+            - len(no_solution)
+            - len(failed)
+            - len(skipped)
+        )
+        self.stats = {
+            "jobs": len(jobs),
+            "solved": solved,  # solved to optimality
+            "time_limited": time_limited,  # stopped early with an incumbent
+            "no_solution": no_solution,  # infeasible, or no solution in time
+            "failed": failed,  # builder or solver raised
+            # not started before the time budget ran out
+            "skipped": [result.name for result in skipped],
+            "wall_time": wall,
+            "jobs_per_sec": solved / wall if wall > 0 else 0.0,
+            "utilization": busy / (wall * self.cores) if wall > 0 else 0.0,
+        }
+
+
+# ----- example batch: seeded orienteering, daily transportation plans, sudoku -----
+def example_jobs(days=50, seeds=50):
+    jobs = []
+    for seed in range(seeds):  # as in lec5/op_random_instance.py
+        rng = np.random.RandomState(seed)
+        loc_x = rng.randint(0, 100, 12)
+        loc_y = rng.randint(0, 100, 12)
+        s = rng.randint(1, 10, 12)
+        jobs.append(Job(f"op-{seed}", backend.orienteering, (loc_x, loc_y, s, 300)))
+    rng = np.random.default_rng(0)
+    cost = [[5, 3, 2, 6], [7, 7, 8, 10], [6, 5, 3, 8]]
+    capacity = [1700, 2000, 1700]
+    for day in range(days):  # demand varies day to day, total within capacity
+        demand = rng.multinomial(rng.integers(3200, sum(capacity) + 1), [0.25] * 4)
+        jobs.append(
+            Job(
+                f"transport-{day}",
+                backend.transportation,
+                (capacity, demand, cost),
+            )
+        )
+    puzzle = np.zeros((9, 9), dtype=int)
+    puzzle[0] = np.arange(1, 10)
+    for k in range(20):  # each puzzle fixes a rotated first row
+        jobs.append(Job(f"sudoku-{k}", backend.sudoku, (np.roll(puzzle, k, axis=1),)))
+    return jobs
+
+
+if __name__ == "__main__":
+    scheduler = SolveScheduler(solver="highs")
+    for result in scheduler.run(example_jobs()):
+        print(f"{result.name:<16}{result.status!s:<10}{result.obj}")
+    stats = scheduler.stats
+    print(
+        f"\n{stats['solved']} of {stats['jobs']} jobs solved "
+        f"in {stats['wall_time']:.2f} s: "
+        f"{stats['jobs_per_sec']:.1f} jobs/s, "
+        f"utilization {stats['utilization']:.0%} "
+        f"({scheduler.workers} workers x {scheduler.threads} threads)"
+    )
+    for key in ("time_limited", "no_solution", "failed", "skipped"):
+        if stats[key]:
+            print(f"{key}: {stats[key]}")
@@ -0,0 +1,83 @@
+import os
+
+import numpy as np
+import pandas as pd
+import pytest
+
+import backend
+
+# expected objectives and where they come from
+EXPECTED = {
+    "transportation": 28200,  # Gurobi output in lec2/lec2.ipynb ("Obj: 28200")
+    "store_selection": 618,  # hw/Homework2.py model, checked by brute force below
+    # HiGHS result, kept as a regression value only: lec4/lec4.ipynb does not
+    # print the p-median objective, so this does not confirm the lec4 model
+    "pmedian": 112.84,
+    "fcfl": 13740.42,  # Gurobi output in lec4/lec4.ipynb ("Total cost: 13740.41...")
+}
+
+
+@pytest.fixture(scope="module")
+def models():
+    return backend.course_models()
+
+
+@pytest.fixture(scope="module")
+def highs(models):
+    return {name: model.solve("highs") for name, model in models.items()}
+
+
+@pytest.mark.parametrize("name", sorted(EXPECTED))
+def test_highs_objective(highs, name):
+    assert highs[name].status == "optimal"
+    assert highs[name].obj == pytest.approx(EXPECTED[name], abs=0.01)
+
+
+def test_store_selection_brute_force():
+    # revenues and proximity sets as in course_models() / hw/Homework2.py
+    revenues = np.array([127, 83, 165, 96, 112, 88, 135, 141, 117, 94])
+    proximity_sets = [[1, 2, 4], [1, 3], [4, 5, 6], [6, 7, 8], [6, 9], [8, 10], [9, 10]]
+    best = 0
+    for mask in range(1 << 10):
+        open_ = [(mask >> (s - 1)) & 1 for s in range(1, 11)]
+        if all(sum(open_[s - 1] for s in g) <= 1 for g in proximity_sets):
+            best = max(best, int(revenues @ open_))
+    assert best == EXPECTED["store_selection"]
+
+
+def test_highs_sudoku_is_solved():
+    here = os.path.dirname(os.path.abspath(__file__))
+    puzzle = pd.read_excel(os.path.join(here, "lec7", "sudoku_test.xlsx"), header=None)
+    puzzle = puzzle.fillna(0).values.astype(int)
+    model, x = backend.sudoku(puzzle)
+    res = model.solve("highs")
+    assert res.status == "optimal"
+    grid = np.round(res.x[x]).argmax(axis=2) + 1
+    given = puzzle > 0
+    assert (grid[given] == puzzle[given]).all()
+    digits = set(range(1, 10))
+    boxes = grid.reshape(3, 3, 3, 3).transpose(0, 2, 1, 3).reshape(9, 9)
+    for group in (grid, grid.T, boxes):
+        assert all(set(row) == digits for row in group)
+
+
+def test_gurobi_matches_highs(models, highs):
+    pytest.importorskip("gurobipy")
+    for name, model in models.items():
+        res = model.solve("gurobi")
+        assert res.obj == pytest.approx(highs[name].obj, rel=1e-6, abs=1e-6), name
+
+
+def test_add_rows_empty():
+    model = backend.LinearModel("empty")
+    x = model.add_vars(2, ub=1, obj=1.0)
+    assert len(model.add_rows([], [], 1.0, hi=1)) == 0
+    model.add_rows([0, 0], x, 1.0, lo=1)
+    assert model.num_rows == 1
+    assert model.solve("highs").obj == pytest.approx(1.0)
+
+
+def test_compare_single_backend_has_no_verdict(capsys):
+    backend.compare(("highs",))
+    out = capsys.readouterr().out
+    assert "same" not in out and "DIFFERENT" not in out